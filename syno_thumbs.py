@@ -8,15 +8,32 @@ any matching .fail file is removed so absence of .fail signals the thumb is read
 from __future__ import annotations
 
 import argparse
+import json
 import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
 from pathlib import Path
 
+try:
+    import pillow_heif  # optional: HEIC decoding for Pillow
+except ImportError:
+    pillow_heif = None
+
+try:
+    from PIL import Image, ImageOps  # optional: photo thumbnails in-process instead of convert
+except ImportError:
+    Image = ImageOps = None
+
+if Image is not None and pillow_heif is not None:
+    pillow_heif.register_heif_opener()
+
 # Media extensions
-PHOTO_EXTS = {".jpg", ".jpeg", ".png", ".heic", ".gif", ".bmp", ".tiff", ".tif"}
-VIDEO_EXTS = {".mov", ".mp4", ".avi", ".mkv", ".m4v", ".webm", ".wmv"}
+PHOTO_EXTS = frozenset({".jpg", ".jpeg", ".png", ".heic", ".gif", ".bmp", ".tiff", ".tif"})
+VIDEO_EXTS = frozenset({".mov", ".mp4", ".avi", ".mkv", ".m4v", ".webm", ".wmv"})
+ALL_EXTS = PHOTO_EXTS | VIDEO_EXTS
 
 # Thumbnail sizes (from your template)
 # SM: longest edge 320  -> e.g. 320x240
@@ -25,16 +42,28 @@ VIDEO_EXTS = {".mov", ".mp4", ".avi", ".mkv", ".m4v", ".webm", ".wmv"}
 SIZE_SM_LONG = 320
 SIZE_M_SHORT = 320
 SIZE_XL_SHORT = 1280
-# Video SM: longest edge (template had 427x240 for 1920x1080)
+# Video SM: longest edge (template had 427x240 for 1920x1080); M: longest edge 640; XL: original
 SIZE_VIDEO_SM_LONG = 427
+SIZE_VIDEO_M_LONG = 640
+
+# size_spec -> (long_cap, short_cap) for scale_edge()
+PHOTO_CAPS = {"sm": (SIZE_SM_LONG, None), "m": (None, SIZE_M_SHORT), "xl": (None, SIZE_XL_SHORT)}
+VIDEO_CAPS = {"sm": (SIZE_VIDEO_SM_LONG, None), "m": (SIZE_VIDEO_M_LONG, None), "xl": (None, None)}
 
 # Synology package with full codec support (optional)
 FFMPEG7_BIN = Path("/var/packages/ffmpeg7/target/bin/ffmpeg")
 FFMPEG7_PROBE = Path("/var/packages/ffmpeg7/target/bin/ffprobe")
 
+# Probe results kept between runs: str(path) -> [size, mtime_ns, width, height]
+PROBE_CACHE_NAME = ".probe_cache.json"
 
+# "Video: ... 1920x1080" (ffmpeg -i stderr); bytes pattern, the output is scanned undecoded
+_FFMPEG_SIZE_RE = re.compile(rb"(\d{2,})\s*x\s*(\d{2,})")
+
+
+@lru_cache(maxsize=1)
 def resolve_ffmpeg_commands() -> tuple[list[str], list[str]]:
-    """Use ffmpeg7 package on Synology if present, else PATH."""
+    """Use ffmpeg7 package on Synology if present, else PATH. Resolved once per process."""
     if FFMPEG7_BIN.is_file() and os.access(FFMPEG7_BIN, os.X_OK):
         ffprobe_cmd = (
             [str(FFMPEG7_PROBE)]
@@ -45,44 +74,79 @@ def resolve_ffmpeg_commands() -> tuple[list[str], list[str]]:
     return ["ffmpeg"], ["ffprobe"]
 
 
-def get_media_info_ffprobe(path: Path, ffprobe_cmd: list[str], ffmpeg_cmd: list[str]) -> dict | None:
-    """Get width, height via ffprobe (or ffmpeg -i fallback when ffprobe is disabled, e.g. on Synology NAS)."""
-    # Fallback 2: ImageMagick identify (works for most images including HEIC if supported)
+@lru_cache(maxsize=1)
+def verify_ffmpeg(ffmpeg_cmd: tuple[str, ...]) -> bool:
+    """Return True if ffmpeg runs (`-version`). Checked once per process."""
     try:
-        out = subprocess.run(
-            ["identify", "-format", "%w,%h", str(path)],
-            capture_output=True,
-            text=True,
-            timeout=30,
+        subprocess.run(
+            list(ffmpeg_cmd) + ["-version"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+            timeout=5,
         )
-        if out.returncode == 0:
-            line = (out.stdout or "").strip()
-            if line and "," in line:
-                w_str, h_str = line.split(",", 1)
-                w, h = int(w_str), int(h_str)
-                if w > 0 and h > 0:
-                    return {"width": w, "height": h, "duration": None}
-    except (subprocess.TimeoutExpired, FileNotFoundError, ValueError):
-        pass
+    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+        return False
+    return True
+
 
-    # Fallback 3: heif-info (for HEIC files)
+def _load_cache(ea_dir: Path) -> dict[str, list[int]]:
+    """Read the probe cache from ea_dir. A missing or unreadable cache is treated as empty.
+
+    Entries that are not [size, mtime_ns, width, height] lists of ints are dropped.
+    """
     try:
-        out = subprocess.run(
-            ["heif-info", str(path)],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        if out.returncode == 0:
-            for line in (out.stdout or "").splitlines():
-                m = re.search(r"size:\s*(\d+)\s*x\s*(\d+)", line.lower())
-                if m:
-                    w, h = int(m.group(1)), int(m.group(2))
-                    if w > 0 and h > 0:
-                        return {"width": w, "height": h, "duration": None}
-    except (subprocess.TimeoutExpired, FileNotFoundError, ValueError):
-        pass
-    # Try ffprobe first (not available on some NAS builds: --disable-ffprobe)
+        with open(ea_dir / PROBE_CACHE_NAME, encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {
+        k: v for k, v in data.items()
+        if isinstance(v, list) and len(v) == 4 and all(type(n) is int for n in v)
+    }
+
+
+def _save_cache(ea_dir: Path, cache: dict[str, list[int]]) -> None:
+    """Write the probe cache to ea_dir (via a temp file, so a crash never leaves it half-written)."""
+    path = ea_dir / PROBE_CACHE_NAME
+    tmp = path.with_name(PROBE_CACHE_NAME + ".tmp")
+    try:
+        ea_dir.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(cache, fh, separators=(",", ":"))
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"Warning: could not write probe cache {path}: {e}", file=sys.stderr)
+
+
+def get_media_info_ffprobe(
+    path: Path,
+    ffprobe_cmd: list[str],
+    ffmpeg_cmd: list[str],
+    cache: dict | None = None,
+) -> dict | None:
+    """Get width, height, reusing a cached probe when the file's size and mtime are unchanged."""
+    if cache is None:
+        return _probe_video(path, ffprobe_cmd, ffmpeg_cmd)
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    key = str(path)
+    hit = cache.get(key)
+    if hit and hit[0] == st.st_size and hit[1] == st.st_mtime_ns:
+        return {"width": hit[2], "height": hit[3], "duration": None}
+    info = _probe_video(path, ffprobe_cmd, ffmpeg_cmd)
+    if info:
+        cache[key] = [st.st_size, st.st_mtime_ns, info["width"], info["height"]]
+    return info
+
+
+def _probe_video(path: Path, ffprobe_cmd: list[str], ffmpeg_cmd: list[str]) -> dict | None:
+    """Get width, height via ffprobe (or ffmpeg -i fallback when ffprobe is disabled, e.g. on Synology NAS)."""
+    # ffprobe (not available on some NAS builds: --disable-ffprobe)
     try:
         out = subprocess.run(
             ffprobe_cmd
@@ -94,13 +158,13 @@ def get_media_info_ffprobe(path: Path, ffprobe_cmd: list[str], ffmpeg_cmd: list[
                 str(path),
             ],
             capture_output=True,
-            text=True,
             timeout=30,
         )
         if out.returncode == 0:
-            line = (out.stdout or "").strip().splitlines()[0]
+            lines = out.stdout.strip().splitlines()
+            line = lines[0] if lines else b""
             if line:
-                parts = line.split(",")
+                parts = line.split(b",")
                 w = int(parts[0]) if len(parts) > 0 and parts[0].strip().isdigit() else None
                 h = int(parts[1]) if len(parts) > 1 and parts[1].strip().isdigit() else None
                 if w and h:
@@ -113,13 +177,12 @@ def get_media_info_ffprobe(path: Path, ffprobe_cmd: list[str], ffmpeg_cmd: list[
         out = subprocess.run(
             ffmpeg_cmd + ["-i", str(path)],
             capture_output=True,
-            text=True,
             timeout=30,
         )
-        err = (out.stderr or "") + (out.stdout or "")
+        err = out.stderr + out.stdout
         for line in err.splitlines():
-            if "Video:" in line or "video:" in line:
-                m = re.search(r"(\d{2,})\s*x\s*(\d{2,})", line)
+            if b"Video:" in line or b"video:" in line:
+                m = _FFMPEG_SIZE_RE.search(line)
                 if m:
                     w, h = int(m.group(1)), int(m.group(2))
                     if w > 0 and h > 0:
@@ -131,95 +194,145 @@ def get_media_info_ffprobe(path: Path, ffprobe_cmd: list[str], ffmpeg_cmd: list[
 
 
 
-def scale_args(width: int, height: int, size_spec: str) -> tuple[int, int]:
-    """Return (w, h) for scale filter. size_spec: 'sm' | 'm' | 'xl'."""
-    if size_spec == "sm":
-        # Longest edge = SIZE_SM_LONG
-        if width >= height:
-            if width <= SIZE_SM_LONG:
-                return width, height
-            return SIZE_SM_LONG, max(1, round(height * SIZE_SM_LONG / width))
-        else:
-            if height <= SIZE_SM_LONG:
-                return width, height
-            return max(1, round(width * SIZE_SM_LONG / height)), SIZE_SM_LONG
-    elif size_spec == "m":
-        # Shortest edge = SIZE_M_SHORT
-        if width >= height:
-            if height <= SIZE_M_SHORT:
-                return width, height
-            return max(1, round(width * SIZE_M_SHORT / height)), SIZE_M_SHORT
-        else:
-            if width <= SIZE_M_SHORT:
-                return width, height
-            return SIZE_M_SHORT, max(1, round(height * SIZE_M_SHORT / width))
-    else:  # xl
-        # Shortest edge = SIZE_XL_SHORT (cap to original)
-        if width >= height:
-            if height <= SIZE_XL_SHORT:
-                return width, height
-            return max(1, round(width * SIZE_XL_SHORT / height)), SIZE_XL_SHORT
-        else:
-            if width <= SIZE_XL_SHORT:
-                return width, height
-            return SIZE_XL_SHORT, max(1, round(height * SIZE_XL_SHORT / width))
-
-
-def scale_args_video(width: int, height: int, size_spec: str) -> tuple[int, int]:
-    """Video: SM = longest 427; M = 640 long; XL = original (or 1280 short)."""
-    if size_spec == "sm":
-        if width >= height:
-            if width <= SIZE_VIDEO_SM_LONG:
-                return width, height
-            return SIZE_VIDEO_SM_LONG, max(1, round(height * SIZE_VIDEO_SM_LONG / width))
-        else:
-            if height <= SIZE_VIDEO_SM_LONG:
-                return width, height
-            return max(1, round(width * SIZE_VIDEO_SM_LONG / height)), SIZE_VIDEO_SM_LONG
-    elif size_spec == "m":
-        long_edge = 640
-        if width >= height:
-            if width <= long_edge:
-                return width, height
-            return long_edge, max(1, round(height * long_edge / width))
-        else:
-            if height <= long_edge:
-                return width, height
-            return max(1, round(width * long_edge / height)), long_edge
+@lru_cache(maxsize=256)
+def scale_edge(width: int, height: int, long_cap: int | None = None, short_cap: int | None = None) -> tuple[int, int]:
+    """Scale (width, height) so the long edge is long_cap or the short edge is short_cap; never upscale."""
+    if long_cap is not None:
+        edge, cap = max(width, height), long_cap
+    elif short_cap is not None:
+        edge, cap = min(width, height), short_cap
     else:
         return width, height
+    if edge <= cap:
+        return width, height
+    return max(1, round(width * cap / edge)), max(1, round(height * cap / edge))
+
+
+def _video_input_args(input_path: Path, seek: float) -> list[str]:
+    """ffmpeg input options for grabbing one frame. Seeks (if any) jump straight to the nearest keyframe."""
+    args = ["-fflags", "+fastseek"]
+    if seek > 0.0:
+        args += ["-noaccurate_seek", "-ss", str(seek)]
+    return args + ["-i", str(input_path)]
+
 
 def run_ffmpeg_thumb(
     input_path: Path,
     output_path: Path,
     width: int,
     height: int,
-    is_video: bool,
     ffmpeg_cmd: list[str],
     seek: float = 0.0,
 ) -> bool:
-    """Generate one thumbnail with ffmpeg. Returns True on success."""
+    """Generate one video thumbnail with ffmpeg. Returns True on success."""
     scale = f"scale={width}:{height}:force_original_aspect_ratio=decrease"
     cmd = ffmpeg_cmd + [
         "-y",
         "-v", "error",
         "-hide_banner", "-loglevel", "error",
+        # One thread per ffmpeg/convert: parallelism lives at the file level (--jobs)
+        "-threads", "1",
     ]
-    if is_video:
-        cmd += ["-ss", str(seek), "-i", str(input_path), "-vframes", "1"]
-        cmd += ["-vf", scale, "-q:v", "3", str(output_path)]
-    else:
-        print("using convert size: " + str(width))
-        cmd = ["convert"]
-        cmd += ["-auto-orient", "-thumbnail", str(width), input_path, output_path]
-        
+    cmd += _video_input_args(input_path, seek) + ["-frames:v", "1", "-an", "-sn"]
+    # Output-side -threads 1 limits the mjpeg encoder (it defaults to threads=auto)
+    cmd += ["-vf", scale, "-filter_threads", "1", "-q:v", "3", "-threads", "1", str(output_path)]
+
     try:
-        r = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        r = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60)
         return r.returncode == 0 and output_path.is_file()
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return False
 
 
+def run_ffmpeg_thumb_multi(
+    input_path: Path,
+    outputs: list[tuple[Path, int, int]],
+    ffmpeg_cmd: list[str],
+    seek: float = 0.0,
+) -> bool:
+    """Generate several video thumbnails (output, width, height) from one decoded frame. Returns True if all were written."""
+    # split the decoded frame once, scale each branch to its own output
+    n = len(outputs)
+    graph = f"[0:v]split={n}" + "".join(f"[s{i}]" for i in range(n)) + ";" + ";".join(
+        f"[s{i}]scale={w}:{h}:force_original_aspect_ratio=decrease[o{i}]"
+        for i, (_out, w, h) in enumerate(outputs)
+    )
+    cmd = ffmpeg_cmd + [
+        "-y",
+        "-v", "error",
+        "-hide_banner", "-loglevel", "error",
+        "-threads", "1",
+    ]
+    cmd += _video_input_args(input_path, seek) + ["-filter_complex", graph, "-filter_complex_threads", "1"]
+    for i, (out, _w, _h) in enumerate(outputs):
+        # Output-side -threads 1: each output has its own mjpeg encoder, otherwise threads=auto
+        cmd += ["-map", f"[o{i}]", "-frames:v", "1", "-q:v", "3", "-threads", "1", str(out)]
+
+    try:
+        r = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60)
+        return r.returncode == 0 and all(out.is_file() for out, _w, _h in outputs)
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False
+
+
+def _convert_geometry(size_spec: str) -> str:
+    """ImageMagick geometry for a photo size_spec; needs no source dimensions.
+
+    "NxN>" fits the long edge to N, "NxN^>" the short edge (^ = fill the box); ">" never upscales.
+    """
+    long_cap, short_cap = PHOTO_CAPS[size_spec]
+    if long_cap is not None:
+        return f"{long_cap}x{long_cap}>"
+    return f"{short_cap}x{short_cap}^>"
+
+
+def run_convert_thumbs_multi(input_path: Path, outputs: list[tuple[Path, str]]) -> bool:
+    """Generate photo thumbnails (output, size_spec) with one convert. Returns True if all were written.
+
+    The photo is decoded once; sizes are produced largest first, each one shrinking the previous result
+    and saving it with -write.
+    """
+    ordered = sorted(outputs, key=lambda o: ("xl", "m", "sm").index(o[1]))
+    # Decode hint (before the input file): at least 2x the largest box on both edges,
+    # so libjpeg can decode at 1/2, 1/4 or 1/8 scale
+    hint = 2 * max(cap for cap in PHOTO_CAPS[ordered[0][1]] if cap is not None)
+    cmd = ["convert", "-limit", "thread", "1", "-define", f"jpeg:size={hint}x{hint}"]
+    cmd += [str(input_path), "-auto-orient"]
+    for out, size_spec in ordered[:-1]:
+        cmd += ["-thumbnail", _convert_geometry(size_spec), "-write", str(out)]
+    last_out, last_spec = ordered[-1]
+    cmd += ["-thumbnail", _convert_geometry(last_spec), str(last_out)]
+
+    try:
+        r = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60)
+        return r.returncode == 0 and all(out.is_file() for out, _spec in outputs)
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False
+
+
+def _pillow_thumbs(input_path: Path, outputs: list[tuple[Path, str]]) -> bool:
+    """Decode a photo once with Pillow and write each (output, size_spec) thumbnail. Returns True if all were written."""
+    if Image is None:
+        return False
+    try:
+        with Image.open(input_path) as src:
+            # JPEG: let libjpeg decode at a reduced scale, still at least 2x the largest thumbnail.
+            # The caps are orientation-independent, so the stored (pre-transpose) size works here.
+            targets = [scale_edge(src.width, src.height, *PHOTO_CAPS[spec]) for _out, spec in outputs]
+            tw, th = max(targets, key=lambda t: t[0] * t[1])
+            src.draft("RGB", (2 * tw, 2 * th))
+            img = ImageOps.exif_transpose(src)
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        for out, size_spec in outputs:
+            t = img.copy()
+            t.thumbnail(scale_edge(img.width, img.height, *PHOTO_CAPS[size_spec]), Image.LANCZOS)
+            t.save(out, "JPEG", quality=85, optimize=True)
+    except Exception:  # any Pillow failure falls back to convert
+        return False
+    return True
+
+
 def process_file(
     media_path: Path,
     ea_dir: Path,
@@ -229,55 +342,73 @@ def process_file(
     force: bool,
     ffmpeg_cmd: list[str],
     ffprobe_cmd: list[str],
-) -> bool:
-    """Process one photo or video: create @eaDir/Basename.ext/ and thumbnails only."""
+    probe_cache: dict | None = None,
+    inner_parallel: bool = False,
+) -> tuple[bool, dict[str, list[int]]]:
+    """Process one photo or video: create @eaDir/Basename.ext/ and thumbnails only.
+
+    probe_cache holds this file's cache entry (if any); it is returned, updated after a
+    new probe, so main() can merge the results from all workers.
+    """
+    file_cache = {} if probe_cache is None else probe_cache
     name = media_path.name
     ext = media_path.suffix.lower()
     is_video = ext in VIDEO_EXTS
     is_photo = ext in PHOTO_EXTS
     if not is_photo and not is_video:
-        return True
+        return True, file_cache
 
     ea_subdir = ea_dir / name
     if dry_run:
         print(f"[dry-run] Would process: {media_path} -> {ea_subdir}")
-        return True
+        return True, file_cache
+
+    if not verify_ffmpeg(tuple(ffmpeg_cmd)):
+        print(f"Warning: ffmpeg not usable (tried: {ffmpeg_cmd[0]}), skipping {media_path}", file=sys.stderr)
+        return False, file_cache
 
-    ea_subdir.mkdir(parents=True, exist_ok=True)
+    # One directory listing instead of a stat() per thumbnail
+    try:
+        with os.scandir(ea_subdir) as it:
+            existing = {e.name for e in it}
+    except FileNotFoundError:
+        existing = set()
 
     # Skip entirely if all three thumbnails already exist
-    if not force and all((ea_subdir / f"SYNOPHOTO_THUMB_{s}.jpg").is_file() for s in ("SM", "M", "XL")):
+    if not force and {"SYNOPHOTO_THUMB_SM.jpg", "SYNOPHOTO_THUMB_M.jpg", "SYNOPHOTO_THUMB_XL.jpg"} <= existing:
         if debug:
-            print(f"    (all thumbs exist, skipped)")
-        return True
-
-    info = get_media_info_ffprobe(media_path, ffprobe_cmd, ffmpeg_cmd)
-    print(info)
-    if not info:
-        print(f"Warning: could not get dimensions for {media_path}", file=sys.stderr)
-        return False
-
-    w, h = info["width"], info["height"]
-    if w <= 0 or h <= 0:
-        print(f"Warning: invalid size for {media_path}", file=sys.stderr)
-        return False
+            print(f"    {name}: all thumbs exist, skipped")
+        return True, file_cache
 
-    def do_thumb(suffix: str, size_spec: str) -> bool:
-        print(size_spec)
-        if is_video:
-            tw, th = scale_args_video(w, h, size_spec)
-        else:
-            tw, th = scale_args(w, h, size_spec)
-        print(str(th) + " " + str(tw))
+    # Only videos need probing: Pillow and convert size photos from their own decode
+    video_sizes: dict[str, tuple[int, int]] = {}
+    if is_video:
+        info = get_media_info_ffprobe(media_path, ffprobe_cmd, ffmpeg_cmd, cache=file_cache)
+        if not info:
+            print(f"Warning: could not get dimensions for {media_path}", file=sys.stderr)
+            return False, file_cache
+
+        w, h = info["width"], info["height"]
+        if w <= 0 or h <= 0:
+            print(f"Warning: invalid size for {media_path}", file=sys.stderr)
+            return False, file_cache
+        video_sizes = {spec: scale_edge(w, h, *caps) for spec, caps in VIDEO_CAPS.items()}
+
+    def do_thumb(suffix: str, size_spec: str, batched: bool = False) -> bool:
         out = ea_subdir / f"SYNOPHOTO_THUMB_{suffix}.jpg"
         fail_path = ea_subdir / f"SYNOPHOTO_THUMB_{suffix}.fail"
-        
-        if not force and out.is_file():
+
+        if batched:
+            ok = out.is_file()  # written by the batched call above
+        elif not force and out.name in existing:
             fail_path.unlink(missing_ok=True)
             if debug:
                 print(f"    exists: {name}/{out.name}")
             return True
-        ok = run_ffmpeg_thumb(media_path, out, tw, th, is_video, ffmpeg_cmd, seek=video_seek)
+        elif is_video:
+            ok = run_ffmpeg_thumb(media_path, out, *video_sizes[size_spec], ffmpeg_cmd, seek=video_seek)
+        else:
+            ok = run_convert_thumbs_multi(media_path, [(out, size_spec)])
         if ok:
             fail_path.unlink(missing_ok=True)  # no .fail = thumbnail ready
             if debug:
@@ -288,11 +419,45 @@ def process_file(
                 print(f"    created: {name}/{fail_path.name} (thumbnail failed)")
         return ok
 
-    do_thumb("SM", "sm")
-    do_thumb("M", "m")
-    do_thumb("XL", "xl")
+    sizes = (("SM", "sm"), ("M", "m"), ("XL", "xl"))
+    todo = [
+        (suffix, size_spec) for suffix, size_spec in sizes
+        if force or f"SYNOPHOTO_THUMB_{suffix}.jpg" not in existing
+    ]
+    todo_paths = [ea_subdir / f"SYNOPHOTO_THUMB_{suffix}.jpg" for suffix, _spec in todo]
+    if todo:
+        # Created only now that a thumbnail (or .fail) is actually going to be written
+        ea_subdir.mkdir(parents=True, exist_ok=True)
+    # Write all missing sizes from one decode: Pillow in-process for photos,
+    # else a single ffmpeg/convert run
+    batched = False
+    if todo and not is_video:
+        spec_outputs = [(out, spec) for out, (_suffix, spec) in zip(todo_paths, todo)]
+        batched = _pillow_thumbs(media_path, spec_outputs)
+        if not batched and len(todo) > 1:
+            batched = run_convert_thumbs_multi(media_path, spec_outputs)
+    elif len(todo) > 1:
+        outputs = [(out, *video_sizes[spec]) for out, (_suffix, spec) in zip(todo_paths, todo)]
+        batched = run_ffmpeg_thumb_multi(media_path, outputs, ffmpeg_cmd, seek=video_seek)
+    if todo and not batched:
+        # Drop partial output; each size is retried on its own below
+        for out in todo_paths:
+            out.unlink(missing_ok=True)
+
+    def finish(item: tuple[str, str]) -> bool:
+        suffix, size_spec = item
+        return do_thumb(suffix, size_spec, batched=batched and item in todo)
+
+    if inner_parallel and not batched and len(todo) > 1:
+        # Per-size fallback: run the independent ffmpeg/convert calls side by side
+        # (threads just wait on subprocesses, so the GIL is not a bottleneck)
+        with ThreadPoolExecutor(max_workers=len(sizes)) as ex:
+            list(ex.map(finish, sizes))
+    else:
+        for item in sizes:
+            finish(item)
 
-    return True
+    return True, file_cache
 
 
 def main() -> int:
@@ -334,6 +499,19 @@ def main() -> int:
         action="store_true",
         help="Force thumbnail generation even if all three thumbnails already exist",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=max(1, (os.cpu_count() or 2) // 2),
+        metavar="N",
+        help="Number of files processed in parallel (default: half the CPU count)",
+    )
+    parser.add_argument(
+        "--inner-parallel",
+        action="store_true",
+        help="Create the three sizes of a file concurrently when they cannot be batched "
+        "(uses up to 3 processes per job)",
+    )
     args = parser.parse_args()
 
     directory = args.directory.resolve()
@@ -344,31 +522,62 @@ def main() -> int:
     ea_dir = (args.ea_dir or (directory / "@eaDir")).resolve()
 
     ffmpeg_cmd, ffprobe_cmd = resolve_ffmpeg_commands()
-    try:
-        subprocess.run(ffmpeg_cmd + ["-version"], capture_output=True, check=True, timeout=5)
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+    if not verify_ffmpeg(tuple(ffmpeg_cmd)):
         print("Error: ffmpeg is required (tried: {}).".format(ffmpeg_cmd[0]), file=sys.stderr)
         return 1
 
     if args.debug and not args.dry_run and "ffmpeg7" in ffmpeg_cmd[0]:
         print(f"Using: {ffmpeg_cmd[0]}\n")
 
-    exts = PHOTO_EXTS | VIDEO_EXTS
+    # DirEntry.is_file() uses the type from the directory listing, so regular files need no stat()
+    with os.scandir(directory) as it:
+        entries = sorted(
+            (
+                e for e in it
+                if e.name != "@eaDir"
+                and os.path.splitext(e.name)[1].lower() in ALL_EXTS
+                and e.is_file()
+            ),
+            key=lambda e: e.name,
+        )
+    files = [Path(e.path) for e in entries]
+    probe_cache = {} if args.dry_run else _load_cache(ea_dir)
+    updated: dict[str, list[int]] = {}
     count = 0
-    for f in sorted(directory.iterdir(), key=lambda p: p.name):
-        if f.is_file() and f.suffix.lower() in exts:
-            if args.debug and not args.dry_run:
-                print(f"{f.name}:")
-            process_file(
-                f, ea_dir,
-                video_seek=args.video_seek,
-                dry_run=args.dry_run,
-                debug=args.debug,
-                force=args.force,
-                ffmpeg_cmd=ffmpeg_cmd,
-                ffprobe_cmd=ffprobe_cmd,
-            )
+    # Each file writes only to its own @eaDir/<name>/ subfolder, so workers need no locking.
+    worker = partial(
+        process_file,
+        ea_dir=ea_dir,
+        video_seek=args.video_seek,
+        dry_run=args.dry_run,
+        debug=args.debug,
+        force=args.force,
+        ffmpeg_cmd=ffmpeg_cmd,
+        ffprobe_cmd=ffprobe_cmd,
+        inner_parallel=args.inner_parallel,
+    )
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as ex:
+        futures = {}
+        for f in files:
+            # Workers get only their own cache entry and hand it back (updated) with the result
+            key = str(f)
+            file_cache = {key: probe_cache[key]} if key in probe_cache else {}
+            futures[ex.submit(worker, f, probe_cache=file_cache)] = f
+        for fut in as_completed(futures):
+            # One failing file must not abort the run (or lose the other files' probe results)
+            try:
+                _ok, file_cache = fut.result()
+            except Exception as e:
+                print(f"Warning: {futures[fut].name}: {e}", file=sys.stderr)
+            else:
+                # Only entries for files still in the directory are carried over
+                updated.update(file_cache)
             count += 1
+            if args.debug and not args.dry_run:
+                print(f"[{count}/{len(files)}] {futures[fut].name}")
+
+    if not args.dry_run and updated != probe_cache:
+        _save_cache(ea_dir, updated)
 
     if not args.dry_run:
         print(f"Processed {count} file(s). Thumbnails in {ea_dir}")